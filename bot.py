@@ -1,388 +1,584 @@
-import discord
-from discord import app_commands
-import logging
-from strike_manager import StrikeManager
-from dashboard import StrikeDashboard
-from config import MODERATOR_ROLES, MOD_LOG_CHANNEL_NAME, PUNISHMENT_ESCALATION
-from datetime import datetime
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-class StrikeBot(discord.Client):
-    def __init__(self):
-        intents = discord.Intents.default()
-        intents.members = True
-        intents.message_content = True
-        
-        super().__init__(intents=intents)
-        self.tree = app_commands.CommandTree(self)
-        self.strike_manager = None
-        self.dashboard = None
-    
-    async def setup_hook(self):
-        """Called when the bot is starting up"""
-        logger.info("Starting bot setup...")
-        
-        # Initialize managers
-        self.strike_manager = StrikeManager(self)
-        self.dashboard = StrikeDashboard(self, self.strike_manager)
-        
-        # Sync context menus
-        await self.tree.sync()
-        logger.info("Context menus synced")
-        
-        # Start dashboard updates
-        await self.dashboard.start_auto_updates(interval=30)
-        logger.info("Dashboard auto-updates started")
-    
-    async def on_ready(self):
-        logger.info(f'{self.user} has logged in!')
-        logger.info(f'Bot is in {len(self.guilds)} guilds')
-        
-        # Create dashboard if it doesn't exist
-        await self.dashboard.create_new_dashboard()
-    
-    async def log_strike_action(self, user, moderator, reason, strike_count, violation_count, action_type="strike"):
-        """Log strike actions to mod log channel"""
-        for guild in self.guilds:
-            if user in guild.members:
-                mod_log_channel = await find_mod_log_channel(guild)
-                if mod_log_channel:
-                    if action_type == "strike":
-                        title = "🔨 Strike Issued"
-                        color = discord.Color.orange()
-                    elif action_type == "remove_strike":
-                        title = "🔧 Strike Removed"
-                        color = discord.Color.blue()
-                    elif action_type == "reset_strikes":
-                        title = "🔄 Strikes Reset"
-                        color = discord.Color.green()
-                    else:
-                        title = "📊 Strike Checked"
-                        color = discord.Color.light_grey()
-                    
-                    embed = discord.Embed(
-                        title=title,
-                        color=color,
-                        timestamp=discord.utils.utcnow()
-                    )
-                    embed.add_field(name="User", value=f"{user.mention} ({user.id})", inline=True)
-                    embed.add_field(name="Moderator", value=f"{moderator.mention}", inline=True)
-                    
-                    if action_type != "check":
-                        embed.add_field(name="Current Strikes", value=f"{strike_count}/3", inline=True)
-                        embed.add_field(name="Total Violations", value=violation_count, inline=True)
-                    
-                    if action_type == "strike":
-                        embed.add_field(name="Reason", value=reason, inline=False)
-                        embed.add_field(name="Reset In", value="3 days", inline=True)
-                        
-                        if strike_count >= 3:
-                            timeout_duration = PUNISHMENT_ESCALATION.get(violation_count, 1440)
-                            embed.add_field(
-                                name="⏰ Timeout Applied", 
-                                value=f"{timeout_duration} minutes", 
-                                inline=True
-                            )
-                    
-                    await mod_log_channel.send(embed=embed)
-                break
-
-# Create bot instance
-bot = StrikeBot()
-
-def has_mod_permissions(interaction: discord.Interaction) -> bool:
-    """Check if user has moderator permissions"""
-    has_role = any(role.name in MODERATOR_ROLES for role in interaction.user.roles)
-    return has_role or interaction.user.guild_permissions.administrator
-
-@bot.tree.context_menu(name="Give Strike")
-async def give_strike_context(interaction: discord.Interaction, member: discord.Member):
-    """Context menu command to give a strike"""
-    
-    if not has_mod_permissions(interaction):
-        await interaction.response.send_message(
-            "❌ You don't have permission to use this command.",
-            ephemeral=True
-        )
-        return
-    
-    if member.id == interaction.user.id:
-        await interaction.response.send_message(
-            "❌ You cannot give strikes to yourself.",
-            ephemeral=True
-        )
-        return
-    
-    if member.bot:
-        await interaction.response.send_message(
-            "❌ You cannot give strikes to bots.",
-            ephemeral=True
-        )
-        return
-    
-    # Create modal for strike reason
-    class StrikeReasonModal(discord.ui.Modal, title='Issue Strike'):
-        reason = discord.ui.TextInput(
-            label='Reason for strike',
-            placeholder='Enter the reason for this strike...',
-            max_length=500,
-            style=discord.TextStyle.paragraph
-        )
-        
-        async def on_submit(self, modal_interaction: discord.Interaction):
-            # Give the strike immediately
-            result = await bot.strike_manager.give_strike(
-                member, 
-                modal_interaction.user, 
-                self.reason.value
-            )
-            
-            # Send immediate confirmation
-            embed = discord.Embed(
-                title="✅ Strike Issued",
-                color=discord.Color.green(),
-                timestamp=discord.utils.utcnow()
-            )
-            embed.add_field(name="User", value=f"{member.mention}", inline=True)
-            embed.add_field(name="Strikes", value=f"{result['strike_count']}/3", inline=True)
-            embed.add_field(name="Violations", value=result['violation_count'], inline=True)
-            embed.add_field(name="Reason", value=self.reason.value, inline=False)
-            embed.add_field(name="Reset In", value="3 days", inline=True)
-            
-            await modal_interaction.response.send_message(embed=embed, ephemeral=True)
-            
-            # Log the strike
-            await bot.log_strike_action(
-                member,
-                modal_interaction.user,
-                self.reason.value,
-                result['strike_count'],
-                result['violation_count'],
-                "strike"
-            )
-    
-    modal = StrikeReasonModal()
-    await interaction.response.send_modal(modal)
-
-@bot.tree.context_menu(name="Check Strikes")
-async def check_strikes_context(interaction: discord.Interaction, member: discord.Member):
-    """Context menu command to check strikes for a user"""
-    
-    # Get strike info
-    strike_info = bot.strike_manager.get_user_strike_info(member.id)
-    
-    embed = discord.Embed(
-        title=f"🔍 Strike Info for {member.display_name}",
-        color=discord.Color.blue(),
-        timestamp=discord.utils.utcnow()
-    )
-    
-    embed.add_field(name="Active Strikes", value=f"{strike_info['active_strikes']}/3", inline=True)
-    embed.add_field(name="Total Violations", value=strike_info['violation_count'], inline=True)
-    
-    if strike_info['next_reset']:
-        time_remaining = strike_info['next_reset'] - datetime.now()
-        hours = int(time_remaining.total_seconds() // 3600)
-        minutes = int((time_remaining.total_seconds() % 3600) // 60)
-        reset_text = f"{hours}h {minutes}m"
-    else:
-        reset_text = "No active strikes"
-    
-    embed.add_field(name="Reset In", value=reset_text, inline=True)
-    
-    # Add warning if close to punishment
-    if strike_info['active_strikes'] >= 2:
-        embed.add_field(
-            name="⚠️ Warning", 
-            value=f"Next strike will result in a timeout!", 
-            inline=False
-        )
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    
-    await interaction.response.send_message(embed=embed, ephemeral=True)
-    
-    # Log the check (only if moderator)
-    if has_mod_permissions(interaction):
-        await bot.log_strike_action(
-            member,
-            interaction.user,
-            "Strike check",
-            strike_info['active_strikes'],
-            strike_info['violation_count'],
-            "check"
-        )
-
-@bot.tree.context_menu(name="Remove 1 Strike")
-async def remove_strike_context(interaction: discord.Interaction, member: discord.Member):
-    """Context menu command to remove one strike from a user"""
-    
-    if not has_mod_permissions(interaction):
-        await interaction.response.send_message(
-            "❌ You don't have permission to use this command.",
-            ephemeral=True
-        )
-        return
-    
-    if member.bot:
-        await interaction.response.send_message(
-            "❌ You cannot remove strikes from bots.",
-            ephemeral=True
-        )
-        return
-    
-    # Check current strikes
-    strike_info = bot.strike_manager.get_user_strike_info(member.id)
-    
-    if strike_info['active_strikes'] == 0:
-        await interaction.response.send_message(
-            f"❌ {member.mention} has no active strikes to remove.",
-            ephemeral=True
-        )
-        return
-    
-    # Remove strike immediately
-    result = await bot.strike_manager.remove_strike(member.id)
-    
-    if result['removed']:
-        embed = discord.Embed(
-            title="✅ Strike Removed",
-            color=discord.Color.green(),
-            timestamp=discord.utils.utcnow()
-        )
-        embed.add_field(name="User", value=f"{member.mention}", inline=True)
-        embed.add_field(name="Remaining Strikes", value=f"{result['strike_count']}/3", inline=True)
-        embed.add_field(name="Violations", value=result['violation_count'], inline=True)
-    else:
-        embed = discord.Embed(
-            title="❌ No Strikes to Remove",
-            color=discord.Color.red(),
-            description=f"{member.mention} has no active strikes to remove."
-        )
-    
-    await interaction.response.send_message(embed=embed, ephemeral=True)
-    
-    # Log the action
-    if result['removed']:
-        await bot.log_strike_action(
-            member,
-            interaction.user,
-            "Strike manually removed",
-            result['strike_count'],
-            result['violation_count'],
-            "remove_strike"
-        )
-
-@bot.tree.context_menu(name="Reset Strikes")
-async def reset_strikes_context(interaction: discord.Interaction, member: discord.Member):
-    """Context menu command to reset all strikes for a user"""
-    
-    if not has_mod_permissions(interaction):
-        await interaction.response.send_message(
-            "❌ You don't have permission to use this command.",
-            ephemeral=True
-        )
-        return
-    
-    if member.bot:
-        await interaction.response.send_message(
-            "❌ You cannot reset strikes for bots.",
-            ephemeral=True
-        )
-        return
-    
-    # Check current strikes
-    strike_info = bot.strike_manager.get_user_strike_info(member.id)
-    
-    if strike_info['active_strikes'] == 0:
-        await interaction.response.send_message(
-            f"❌ {member.mention} has no active strikes to reset.",
-            ephemeral=True
-        )
-        return
-    
-    # Reset strikes immediately
-    result = await bot.strike_manager.reset_all_strikes(member.id)
-    
-    embed = discord.Embed(
-        title="✅ Strikes Reset",
-        color=discord.Color.green(),
-        timestamp=discord.utils.utcnow()
-    )
-    embed.add_field(name="User", value=f"{member.mention}", inline=True)
-    embed.add_field(name="Strikes Removed", value=result['strikes_removed'], inline=True)
-    embed.add_field(name="Violations", value=result['violation_count'], inline=True)
-    
-    await interaction.response.send_message(embed=embed, ephemeral=True)
-    
-    # Log the action
-    await bot.log_strike_action(
-        member,
-        interaction.user,
-        "All strikes manually reset",
-        0,  # Strikes are now 0
-        result['violation_count'],
-        "reset_strikes"
-    )
-
-async def find_mod_log_channel(guild):
-    """Find or create mod log channel"""
-    # Look for existing channel
-    for channel in guild.text_channels:
-        if channel.name == MOD_LOG_CHANNEL_NAME:
-            return channel
-    
-    # Create new channel if has permissions
-    try:
-        overwrites = {
-            guild.default_role: discord.PermissionOverwrite(read_messages=False),
-            guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True)
-        }
-        
-        # Add moderator roles
-        for role in guild.roles:
-            if role.name in MODERATOR_ROLES:
-                overwrites[role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
-        
-        channel = await guild.create_text_channel(
-            MOD_LOG_CHANNEL_NAME,
-            overwrites=overwrites,
-            reason="Mod log channel for strike system"
-        )
-        return channel
-    except Exception as e:
-        logger.error(f"Error creating mod log channel: {e}")
-        return None
-
-@bot.event
-async def on_guild_join(guild):
-    """Create necessary channels when bot joins a guild"""
-    await find_mod_log_channel(guild)
-    
-    # Look for or create dashboard channel
-    dashboard_channel = None
-    for channel in guild.text_channels:
-        if channel.name == "👮‍♂️warnings-monitor":
-            dashboard_channel = channel
-            break
-    
-    if not dashboard_channel:
-        try:
-            overwrites = {
-                guild.default_role: discord.PermissionOverwrite(read_messages=True),
-                guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True)
-            }
-            
-            dashboard_channel = await guild.create_text_channel(
-                "👮‍♂️warnings-monitor",
-                overwrites=overwrites,
-                reason="Strike system dashboard"
-            )
-        except Exception as e:
-            logger.error(f"Error creating dashboard channel: {e}")
\ No newline at end of file
+import asyncio
+import collections
+import discord
+from discord import app_commands
+import logging
+from strike_manager import StrikeManager
+from dashboard import StrikeDashboard
+from config import MODERATOR_ROLES, MOD_LOG_CHANNEL_NAME, PUNISHMENT_ESCALATION
+from datetime import datetime
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Mod-log embed titles and colors per action type
+_ACTION_META = {
+    "strike": ("🔨 Strike Issued", 0xE67E22),
+    "remove_strike": ("🔧 Strike Removed", 0x3498DB),
+    "reset_strikes": ("🔄 Strikes Reset", 0x2ECC71),
+    "check": ("📊 Strike Checked", 0xBDC3C7),
+}
+
+class StrikeBot(discord.Client):
+    def __init__(self):
+        intents = discord.Intents.default()
+        intents.members = True
+        intents.message_content = True
+        
+        super().__init__(intents=intents)
+        self.tree = app_commands.CommandTree(self)
+        self.strike_manager = None
+        self.dashboard = None
+        # Per-guild channel caches so we don't rescan guild.text_channels
+        # on every strike/check event
+        self._mod_log_cache: dict[int, int] = {}
+        self._dashboard_cache: dict[int, int] = {}
+        # Resolved moderator role ids per guild so permission checks are
+        # a set intersection instead of name comparisons
+        self._mod_role_ids: dict[int, frozenset[int]] = {}
+        # Mod-log embeds queued for the background writer; bounded so a
+        # Discord outage can't grow memory without limit
+        self._modlog_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._modlog_task = None
+        # Guilds where channel creation already failed, so we don't
+        # retry the REST call on every action
+        self._channel_create_failed: set[int] = set()
+        # Reverse index of which guilds contain a user, maintained via
+        # member join/remove events, so mod-log guild resolution is O(1)
+        self._user_guilds: dict[int, set[int]] = collections.defaultdict(set)
+
+    def get_mod_role_ids(self, guild):
+        """Get the cached moderator role ids for a guild"""
+        role_ids = self._mod_role_ids.get(guild.id)
+        if role_ids is None:
+            role_ids = frozenset(
+                role.id for role in guild.roles if role.name in MODERATOR_ROLES
+            )
+            self._mod_role_ids[guild.id] = role_ids
+        return role_ids
+    
+    async def setup_hook(self):
+        """Called when the bot is starting up"""
+        logger.info("Starting bot setup...")
+        
+        # Initialize managers
+        self.strike_manager = StrikeManager(self)
+        self.dashboard = StrikeDashboard(self, self.strike_manager)
+        
+        # Sync context menus
+        await self.tree.sync()
+        logger.info("Context menus synced")
+        
+        # Start dashboard updates
+        await self.dashboard.start_auto_updates(interval=30)
+        logger.info("Dashboard auto-updates started")
+
+        # Start the mod-log background writer
+        self._modlog_task = self.loop.create_task(self._modlog_writer())
+        logger.info("Mod log writer started")
+
+    async def _modlog_writer(self):
+        """Drain queued mod-log embeds, batching bursts into one message
+
+        Discord allows up to 10 embeds per message, so a burst of strike
+        events in the same guild becomes a single REST call instead of
+        one send per event.
+        """
+        while True:
+            try:
+                item = await self._modlog_queue.get()
+                batch = [item]
+                while len(batch) < 10:
+                    try:
+                        batch.append(self._modlog_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                by_guild = {}
+                for guild_id, embed in batch:
+                    by_guild.setdefault(guild_id, []).append(embed)
+
+                for guild_id, embeds in by_guild.items():
+                    guild = self.get_guild(guild_id)
+                    if not guild:
+                        continue
+                    mod_log_channel = await find_mod_log_channel(guild)
+                    if not mod_log_channel:
+                        continue
+
+                    # Re-chunk per message: Discord caps a message at 10
+                    # embeds AND 6000 characters across all of them, and
+                    # long strike reasons can hit the latter first
+                    chunk: list = []
+                    chunk_len = 0
+                    chunks = []
+                    for embed in embeds:
+                        if chunk and (len(chunk) >= 10 or chunk_len + len(embed) > 6000):
+                            chunks.append(chunk)
+                            chunk = []
+                            chunk_len = 0
+                        chunk.append(embed)
+                        chunk_len += len(embed)
+                    if chunk:
+                        chunks.append(chunk)
+
+                    for chunk in chunks:
+                        try:
+                            await mod_log_channel.send(embeds=chunk)
+                        except discord.HTTPException:
+                            # Don't discard the whole batch on a rejected
+                            # payload; fall back to individual sends
+                            for embed in chunk:
+                                try:
+                                    await mod_log_channel.send(embed=embed)
+                                except Exception as e:
+                                    logger.error(f"Error sending mod log entry: {e}")
+                        except Exception as e:
+                            logger.error(f"Error sending mod log batch: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # One bad batch must not kill the writer for the process
+                # lifetime; log and keep draining
+                logger.error(f"Error in mod log writer: {e}")
+    
+    async def on_ready(self):
+        logger.info(f'{self.user} has logged in!')
+        logger.info(f'Bot is in {len(self.guilds)} guilds')
+
+        # Prime the user -> guilds reverse index from the member cache
+        for guild in self.guilds:
+            for member in guild.members:
+                self._user_guilds[member.id].add(guild.id)
+
+        # Create dashboard if it doesn't exist
+        await self.dashboard.create_new_dashboard()
+
+    async def on_member_join(self, member):
+        self._user_guilds[member.id].add(member.guild.id)
+
+    async def on_member_remove(self, member):
+        self._user_guilds[member.id].discard(member.guild.id)
+    
+    async def log_strike_action(self, user, moderator, reason, strike_count, violation_count, action_type="strike", timestamp=None):
+        """Queue a strike action for the mod log writer"""
+        guild = next(
+            filter(None, (self.get_guild(gid) for gid in self._user_guilds.get(user.id, ()))),
+            None
+        )
+        if not guild:
+            # Index miss (e.g. member cache was incomplete at startup)
+            guild = next((g for g in self.guilds if g.get_member(user.id)), None)
+        if not guild:
+            return
+
+        title, color_int = _ACTION_META.get(action_type, _ACTION_META["check"])
+
+        fields = [
+            {"name": "User", "value": f"{user.mention} ({user.id})", "inline": True},
+            {"name": "Moderator", "value": f"{moderator.mention}", "inline": True},
+        ]
+
+        if action_type != "check":
+            fields.append({"name": "Current Strikes", "value": f"{strike_count}/3", "inline": True})
+            fields.append({"name": "Total Violations", "value": str(violation_count), "inline": True})
+
+        if action_type == "strike":
+            fields.append({"name": "Reason", "value": reason, "inline": False})
+            fields.append({"name": "Reset In", "value": "3 days", "inline": True})
+
+            if strike_count >= 3:
+                timeout_duration = PUNISHMENT_ESCALATION.get(violation_count, 1440)
+                fields.append({
+                    "name": "⏰ Timeout Applied",
+                    "value": f"{timeout_duration} minutes",
+                    "inline": True
+                })
+
+        payload = {
+            "title": title,
+            "color": color_int,
+            "timestamp": (timestamp or discord.utils.utcnow()).isoformat(),
+            "fields": fields,
+        }
+        embed = discord.Embed.from_dict(payload)
+
+        try:
+            self._modlog_queue.put_nowait((guild.id, embed))
+        except asyncio.QueueFull:
+            logger.warning("Mod log queue full, dropping log entry")
+
+# Create bot instance
+bot = StrikeBot()
+
+class StrikeReasonModal(discord.ui.Modal, title='Issue Strike'):
+    """Modal prompting for a strike reason for the targeted member"""
+    reason = discord.ui.TextInput(
+        label='Reason for strike',
+        placeholder='Enter the reason for this strike...',
+        max_length=500,
+        style=discord.TextStyle.paragraph
+    )
+
+    def __init__(self, target: discord.Member):
+        super().__init__()
+        self.target = target
+
+    async def on_submit(self, modal_interaction: discord.Interaction):
+        now = discord.utils.utcnow()
+
+        # Give the strike immediately
+        result = await bot.strike_manager.give_strike(
+            self.target,
+            modal_interaction.user,
+            self.reason.value
+        )
+
+        # Send immediate confirmation
+        embed = discord.Embed(
+            title="✅ Strike Issued",
+            color=discord.Color.green(),
+            timestamp=now
+        )
+        embed.add_field(name="User", value=f"{self.target.mention}", inline=True)
+        embed.add_field(name="Strikes", value=f"{result['strike_count']}/3", inline=True)
+        embed.add_field(name="Violations", value=result['violation_count'], inline=True)
+        embed.add_field(name="Reason", value=self.reason.value, inline=False)
+        embed.add_field(name="Reset In", value="3 days", inline=True)
+
+        await modal_interaction.response.send_message(embed=embed, ephemeral=True)
+
+        # Log the strike
+        await bot.log_strike_action(
+            self.target,
+            modal_interaction.user,
+            self.reason.value,
+            result['strike_count'],
+            result['violation_count'],
+            "strike",
+            timestamp=now
+        )
+
+def has_mod_permissions(interaction: discord.Interaction) -> bool:
+    """Check if user has moderator permissions"""
+    mod_role_ids = bot.get_mod_role_ids(interaction.guild)
+    user_role_ids = {role.id for role in interaction.user.roles}
+    return bool(user_role_ids & mod_role_ids) or interaction.user.guild_permissions.administrator
+
+@bot.tree.context_menu(name="Give Strike")
+async def give_strike_context(interaction: discord.Interaction, member: discord.Member):
+    """Context menu command to give a strike"""
+    
+    if not has_mod_permissions(interaction):
+        await interaction.response.send_message(
+            "❌ You don't have permission to use this command.",
+            ephemeral=True
+        )
+        return
+    
+    if member.id == interaction.user.id:
+        await interaction.response.send_message(
+            "❌ You cannot give strikes to yourself.",
+            ephemeral=True
+        )
+        return
+    
+    if member.bot:
+        await interaction.response.send_message(
+            "❌ You cannot give strikes to bots.",
+            ephemeral=True
+        )
+        return
+    
+    await interaction.response.send_modal(StrikeReasonModal(member))
+
+@bot.tree.context_menu(name="Check Strikes")
+async def check_strikes_context(interaction: discord.Interaction, member: discord.Member):
+    """Context menu command to check strikes for a user"""
+    
+    now = discord.utils.utcnow()
+
+    # Get strike info
+    strike_info = await asyncio.to_thread(bot.strike_manager.get_user_strike_info, member.id)
+
+    embed = discord.Embed(
+        title=f"🔍 Strike Info for {member.display_name}",
+        color=discord.Color.blue(),
+        timestamp=now
+    )
+    
+    embed.add_field(name="Active Strikes", value=f"{strike_info['active_strikes']}/3", inline=True)
+    embed.add_field(name="Total Violations", value=strike_info['violation_count'], inline=True)
+    
+    if strike_info['next_reset']:
+        time_remaining = strike_info['next_reset'] - datetime.now()
+        hours = int(time_remaining.total_seconds() // 3600)
+        minutes = int((time_remaining.total_seconds() % 3600) // 60)
+        reset_text = f"{hours}h {minutes}m"
+    else:
+        reset_text = "No active strikes"
+    
+    embed.add_field(name="Reset In", value=reset_text, inline=True)
+    
+    # Add warning if close to punishment
+    if strike_info['active_strikes'] >= 2:
+        embed.add_field(
+            name="⚠️ Warning", 
+            value=f"Next strike will result in a timeout!", 
+            inline=False
+        )
+    
+    embed.set_thumbnail(url=member.display_avatar.url)
+    
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    # Log the check (only if moderator)
+    if has_mod_permissions(interaction):
+        await bot.log_strike_action(
+            member,
+            interaction.user,
+            "Strike check",
+            strike_info['active_strikes'],
+            strike_info['violation_count'],
+            "check",
+            timestamp=now
+        )
+
+@bot.tree.context_menu(name="Remove 1 Strike")
+async def remove_strike_context(interaction: discord.Interaction, member: discord.Member):
+    """Context menu command to remove one strike from a user"""
+    
+    if not has_mod_permissions(interaction):
+        await interaction.response.send_message(
+            "❌ You don't have permission to use this command.",
+            ephemeral=True
+        )
+        return
+    
+    if member.bot:
+        await interaction.response.send_message(
+            "❌ You cannot remove strikes from bots.",
+            ephemeral=True
+        )
+        return
+    
+    # Check current strikes
+    strike_info = await asyncio.to_thread(bot.strike_manager.get_user_strike_info, member.id)
+    
+    if strike_info['active_strikes'] == 0:
+        await interaction.response.send_message(
+            f"❌ {member.mention} has no active strikes to remove.",
+            ephemeral=True
+        )
+        return
+    
+    now = discord.utils.utcnow()
+
+    # Remove strike immediately
+    result = await bot.strike_manager.remove_strike(member.id)
+
+    if result['removed']:
+        embed = discord.Embed(
+            title="✅ Strike Removed",
+            color=discord.Color.green(),
+            timestamp=now
+        )
+        embed.add_field(name="User", value=f"{member.mention}", inline=True)
+        embed.add_field(name="Remaining Strikes", value=f"{result['strike_count']}/3", inline=True)
+        embed.add_field(name="Violations", value=result['violation_count'], inline=True)
+    else:
+        embed = discord.Embed(
+            title="❌ No Strikes to Remove",
+            color=discord.Color.red(),
+            description=f"{member.mention} has no active strikes to remove."
+        )
+    
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    # Log the action
+    if result['removed']:
+        await bot.log_strike_action(
+            member,
+            interaction.user,
+            "Strike manually removed",
+            result['strike_count'],
+            result['violation_count'],
+            "remove_strike",
+            timestamp=now
+        )
+
+@bot.tree.context_menu(name="Reset Strikes")
+async def reset_strikes_context(interaction: discord.Interaction, member: discord.Member):
+    """Context menu command to reset all strikes for a user"""
+    
+    if not has_mod_permissions(interaction):
+        await interaction.response.send_message(
+            "❌ You don't have permission to use this command.",
+            ephemeral=True
+        )
+        return
+    
+    if member.bot:
+        await interaction.response.send_message(
+            "❌ You cannot reset strikes for bots.",
+            ephemeral=True
+        )
+        return
+    
+    # Check current strikes
+    strike_info = await asyncio.to_thread(bot.strike_manager.get_user_strike_info, member.id)
+    
+    if strike_info['active_strikes'] == 0:
+        await interaction.response.send_message(
+            f"❌ {member.mention} has no active strikes to reset.",
+            ephemeral=True
+        )
+        return
+    
+    now = discord.utils.utcnow()
+
+    # Reset strikes immediately
+    result = await bot.strike_manager.reset_all_strikes(member.id)
+
+    embed = discord.Embed(
+        title="✅ Strikes Reset",
+        color=discord.Color.green(),
+        timestamp=now
+    )
+    embed.add_field(name="User", value=f"{member.mention}", inline=True)
+    embed.add_field(name="Strikes Removed", value=result['strikes_removed'], inline=True)
+    embed.add_field(name="Violations", value=result['violation_count'], inline=True)
+    
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    # Log the action
+    await bot.log_strike_action(
+        member,
+        interaction.user,
+        "All strikes manually reset",
+        0,  # Strikes are now 0
+        result['violation_count'],
+        "reset_strikes",
+        timestamp=now
+    )
+
+async def find_mod_log_channel(guild):
+    """Find or create mod log channel"""
+    # Check the cache first to avoid rescanning the channel list
+    cached_id = bot._mod_log_cache.get(guild.id)
+    if cached_id:
+        channel = bot.get_channel(cached_id)
+        if channel:
+            return channel
+        bot._mod_log_cache.pop(guild.id, None)
+
+    # Look for existing channel
+    for channel in guild.text_channels:
+        if channel.name == MOD_LOG_CHANNEL_NAME:
+            bot._mod_log_cache[guild.id] = channel.id
+            return channel
+
+    # Fail fast if creation already failed or we lack the permission
+    if guild.id in bot._channel_create_failed:
+        return None
+    if not guild.me.guild_permissions.manage_channels:
+        logger.warning(f"Missing manage_channels permission in {guild.name}, cannot create mod log channel")
+        bot._channel_create_failed.add(guild.id)
+        return None
+
+    # Create new channel if has permissions
+    try:
+        overwrites = {
+            guild.default_role: discord.PermissionOverwrite(read_messages=False),
+            guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True)
+        }
+        
+        # Add moderator roles
+        for role in guild.roles:
+            if role.name in MODERATOR_ROLES:
+                overwrites[role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+        
+        channel = await guild.create_text_channel(
+            MOD_LOG_CHANNEL_NAME,
+            overwrites=overwrites,
+            reason="Mod log channel for strike system"
+        )
+        bot._mod_log_cache[guild.id] = channel.id
+        return channel
+    except Exception as e:
+        logger.error(f"Error creating mod log channel: {e}")
+        bot._channel_create_failed.add(guild.id)
+        return None
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    """Invalidate channel caches when a cached channel is deleted"""
+    if bot._mod_log_cache.get(channel.guild.id) == channel.id:
+        bot._mod_log_cache.pop(channel.guild.id, None)
+    if bot._dashboard_cache.get(channel.guild.id) == channel.id:
+        bot._dashboard_cache.pop(channel.guild.id, None)
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    """Invalidate channel caches when a cached channel is renamed"""
+    if before.name != after.name:
+        if bot._mod_log_cache.get(after.guild.id) == after.id:
+            bot._mod_log_cache.pop(after.guild.id, None)
+        if bot._dashboard_cache.get(after.guild.id) == after.id:
+            bot._dashboard_cache.pop(after.guild.id, None)
+
+@bot.event
+async def on_guild_role_create(role):
+    """Invalidate the mod role cache when roles change"""
+    bot._mod_role_ids.pop(role.guild.id, None)
+
+@bot.event
+async def on_guild_role_delete(role):
+    """Invalidate the mod role cache when roles change"""
+    bot._mod_role_ids.pop(role.guild.id, None)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    """Invalidate the mod role cache when roles change"""
+    if before.name != after.name:
+        bot._mod_role_ids.pop(after.guild.id, None)
+
+@bot.event
+async def on_guild_join(guild):
+    """Create necessary channels when bot joins a guild"""
+    bot.get_mod_role_ids(guild)
+    await find_mod_log_channel(guild)
+    
+    # Look for or create dashboard channel
+    dashboard_channel = None
+    for channel in guild.text_channels:
+        if channel.name == "👮‍♂️warnings-monitor":
+            dashboard_channel = channel
+            break
+    
+    if not dashboard_channel:
+        if guild.id in bot._channel_create_failed:
+            return
+        if not guild.me.guild_permissions.manage_channels:
+            logger.warning(f"Missing manage_channels permission in {guild.name}, cannot create dashboard channel")
+            bot._channel_create_failed.add(guild.id)
+            return
+
+        try:
+            overwrites = {
+                guild.default_role: discord.PermissionOverwrite(read_messages=True),
+                guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True)
+            }
+
+            dashboard_channel = await guild.create_text_channel(
+                "👮‍♂️warnings-monitor",
+                overwrites=overwrites,
+                reason="Strike system dashboard"
+            )
+        except Exception as e:
+            logger.error(f"Error creating dashboard channel: {e}")
+            bot._channel_create_failed.add(guild.id)
\ No newline at end of file
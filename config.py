@@ -15,7 +15,7 @@ STRIKE_RESET_HOURS = 72  # 3 days
 DASHBOARD_UPDATE_INTERVAL = 5  # seconds
 
 # Moderation Roles (case-sensitive)
-MODERATOR_ROLES = ["Admin", "Hub President","Hub Moderator"]
+MODERATOR_ROLES = frozenset({"Admin", "Hub President", "Hub Moderator"})
 
 # Punishment Escalation (strikes → timeout minutes)
 PUNISHMENT_ESCALATION = {
@@ -1,7 +1,9 @@
 import discord
 from datetime import datetime
 import asyncio
+import json
 import logging
+import time
 from strike_manager import StrikeManager
 from config import DASHBOARD_CHANNEL_NAME
 
@@ -12,21 +14,34 @@ class StrikeDashboard:
         self.bot = bot
         self.strike_manager = strike_manager
         self.update_task = None
+        # Set by strike mutations so the update loop wakes immediately
+        # instead of waiting out its sleep
+        self._wake = asyncio.Event()
+        # Seconds to wait after a wakeup so bursts of strikes coalesce
+        # into a single dashboard edit
+        self._debounce = 2.0
+        # Hashes of the last sent state so unchanged ticks skip the REST edit
+        self._last_strikes_hash = None
+        self._last_embed_hash = None
+        # Resolved display names with expiry so ticks skip user lookups
+        self._user_name_cache: dict[int, tuple[str, float]] = {}
+        self._name_cache_ttl = 300  # seconds
+        # Cached "no active strikes" embed reused across idle ticks
+        self._empty_embed = None
     
-    def format_time_remaining(self, reset_time):
-        """Format time remaining until strike reset"""
-        if not reset_time:
+    def format_time_remaining(self, reset_ts, now_ts):
+        """Format time remaining until strike reset (epoch seconds)"""
+        if not reset_ts:
             return "No active strikes"
-        
-        now = datetime.now()
-        if reset_time <= now:
+
+        delta = reset_ts - now_ts
+        if delta <= 0:
             return "Resetting soon..."
-        
-        delta = reset_time - now
-        days = delta.days
-        hours = delta.seconds // 3600
-        minutes = (delta.seconds % 3600) // 60
-        
+
+        days, rem = divmod(delta, 86400)
+        hours, rem = divmod(rem, 3600)
+        minutes = rem // 60
+
         if days > 0:
             return f"{days}d {hours}h"
         elif hours > 0:
@@ -34,68 +49,105 @@ class StrikeDashboard:
         else:
             return f"{minutes}m"
     
-    async def create_dashboard_embed(self):
+    async def _resolve_names(self, user_ids):
+        """Resolve display names for a set of user ids.
+
+        Uses the TTL name cache first, then the client's user cache, and
+        only falls back to fetch_user for true misses (batched so the
+        REST calls run concurrently instead of serially).
+        """
+        now = time.monotonic()
+        names = {}
+        missing = []
+
+        for user_id in user_ids:
+            cached = self._user_name_cache.get(user_id)
+            if cached and cached[1] > now:
+                names[user_id] = cached[0]
+                continue
+
+            user = self.bot.get_user(user_id)
+            if user:
+                names[user_id] = f"{user.name}#{user.discriminator}"
+            else:
+                missing.append(user_id)
+
+        if missing:
+            fetched = await asyncio.gather(
+                *(self.bot.fetch_user(user_id) for user_id in missing),
+                return_exceptions=True
+            )
+            for user_id, user in zip(missing, fetched):
+                if isinstance(user, BaseException):
+                    names[user_id] = f"Unknown User ({user_id})"
+                else:
+                    names[user_id] = f"{user.name}#{user.discriminator}"
+
+        expiry = now + self._name_cache_ttl
+        for user_id, name in names.items():
+            self._user_name_cache[user_id] = (name, expiry)
+
+        return names
+
+    def _embed_hash(self, embed):
+        """Hash an embed's payload, ignoring the volatile timestamp"""
+        payload = embed.to_dict()
+        payload.pop('timestamp', None)
+        return hash(json.dumps(payload, sort_keys=True, default=str))
+
+    async def create_dashboard_embed(self, rows=None):
         """Create the dashboard embed"""
+        if rows is None:
+            if self.strike_manager._active_count == 0:
+                rows = []
+            else:
+                rows = await asyncio.to_thread(self.strike_manager.get_dashboard_rows)
+
+        if not rows:
+            if self._empty_embed is None:
+                self._empty_embed = discord.Embed(
+                    title="🚨 Active Strikes Dashboard",
+                    description="Real-time monitoring of active strikes",
+                    color=discord.Color.orange(),
+                    timestamp=datetime.now()
+                )
+                self._empty_embed.add_field(
+                    name="No Active Strikes",
+                    value="There are currently no active strikes.",
+                    inline=False
+                )
+                self._empty_embed.set_footer(text="Updated")
+            # Refresh the timestamp so an edit into the empty state
+            # doesn't render days old; the edit-skip hash ignores it,
+            # so idle ticks still skip the REST call
+            self._empty_embed.timestamp = datetime.now()
+            return self._empty_embed
+
         embed = discord.Embed(
             title="🚨 Active Strikes Dashboard",
             description="Real-time monitoring of active strikes",
             color=discord.Color.orange(),
             timestamp=datetime.now()
         )
-        
+
         try:
-            active_strikes = self.strike_manager.get_all_active_strikes()
-            
-            if not active_strikes:
-                embed.add_field(
-                    name="No Active Strikes",
-                    value="There are currently no active strikes.",
-                    inline=False
-                )
-                return embed
-            
-            # Group strikes by user
-            user_strikes = {}
-            for strike in active_strikes:
-                user_id = strike[1]
-                if user_id not in user_strikes:
-                    user_strikes[user_id] = []
-                user_strikes[user_id].append(strike)
-            
-            for user_id, strikes in user_strikes.items():
-                try:
-                    user = await self.bot.fetch_user(user_id)
-                    user_display = f"{user.name}#{user.discriminator}"
-                except:
-                    user_display = f"Unknown User ({user_id})"
-                
-                strike_count = len(strikes)
-                latest_strike = strikes[0]  # Most recent strike
-                
-                # Get violation count from the database
-                violation_count = self.strike_manager.db.get_violation_count(user_id)
-                
-                # Get moderator info for latest strike
-                try:
-                    moderator = await self.bot.fetch_user(latest_strike[2])
-                    mod_display = f"{moderator.name}#{moderator.discriminator}"
-                except:
-                    mod_display = f"Unknown ({latest_strike[2]})"
-                
-                # Calculate next reset (earliest reset time among active strikes)
-                try:
-                    reset_times = [datetime.fromisoformat(strike[5]) for strike in strikes]
-                    next_reset = min(reset_times)
-                    reset_text = self.format_time_remaining(next_reset)
-                except Exception as e:
-                    logger.error(f"Error calculating reset time: {e}")
-                    reset_text = "Error"
-                
+
+            # Resolve all user and moderator names in one batched pass
+            all_ids = {row[0] for row in rows}
+            all_ids.update(row[4] for row in rows)
+            names = await self._resolve_names(all_ids)
+            now_ts = int(time.time())
+
+            for user_id, strike_count, min_reset, reason, moderator_id, violation_count in rows:
+                user_display = names.get(user_id, f"Unknown User ({user_id})")
+                mod_display = names.get(moderator_id, f"Unknown ({moderator_id})")
+
+                reset_text = self.format_time_remaining(min_reset, now_ts)
+
                 # Truncate reason if too long
-                reason = latest_strike[3]
                 if len(reason) > 50:
                     reason = reason[:47] + "..."
-                
+
                 embed.add_field(
                     name=f"👤 {user_display}",
                     value=(
@@ -122,49 +174,96 @@ class StrikeDashboard:
     async def update_dashboard(self):
         """Update the dashboard message"""
         try:
-            channel_id, message_id = self.strike_manager.db.get_dashboard_message()
-            
+            # Skip the whole tick if the strike data hasn't changed;
+            # when nothing is active, don't touch the DB at all
+            if self.strike_manager._active_count == 0:
+                rows = []
+            else:
+                rows = await asyncio.to_thread(self.strike_manager.get_dashboard_rows)
+            strikes_hash = hash(tuple(rows))
+            if strikes_hash == self._last_strikes_hash:
+                logger.debug("Strike data unchanged, skipping dashboard update")
+                return
+
+            channel_id, message_id = await asyncio.to_thread(
+                self.strike_manager.db.get_dashboard_message
+            )
+
             if not channel_id or not message_id:
                 logger.info("No dashboard message found, creating new one")
                 await self.create_new_dashboard()
                 return
-            
+
             channel = self.bot.get_channel(channel_id)
             if not channel:
                 logger.error(f"Dashboard channel {channel_id} not found")
                 return
-            
+
             try:
                 message = await channel.fetch_message(message_id)
-                embed = await self.create_dashboard_embed()
+                embed = await self.create_dashboard_embed(rows)
+
+                # Skip the REST edit when the rendered content is identical
+                embed_hash = self._embed_hash(embed)
+                if embed_hash == self._last_embed_hash:
+                    self._last_strikes_hash = strikes_hash
+                    logger.debug("Dashboard content unchanged, skipping edit")
+                    return
+
                 await message.edit(embed=embed)
+                self._last_strikes_hash = strikes_hash
+                self._last_embed_hash = embed_hash
                 logger.debug("Dashboard updated successfully")
             except discord.NotFound:
                 logger.info("Dashboard message not found, creating new one")
                 await self.create_new_dashboard()
+            except discord.HTTPException:
+                # Let the update loop's backoff retry transient Discord
+                # errors; swallowing them here would leave the dashboard
+                # stale until the next mutation or reset
+                raise
             except Exception as e:
                 logger.error(f"Error updating dashboard: {e}")
-                
+
+        except discord.HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error in update_dashboard: {e}")
     
     async def create_new_dashboard(self):
         """Create a new dashboard message"""
         try:
-            # Find dashboard channel
+            # Find dashboard channel (cached per guild to avoid rescanning)
             dashboard_channel = None
             for guild in self.bot.guilds:
+                cached_id = self.bot._dashboard_cache.get(guild.id)
+                if cached_id:
+                    dashboard_channel = self.bot.get_channel(cached_id)
+                    if dashboard_channel:
+                        break
+                    self.bot._dashboard_cache.pop(guild.id, None)
                 for channel in guild.text_channels:
                     if channel.name == DASHBOARD_CHANNEL_NAME:
                         dashboard_channel = channel
+                        self.bot._dashboard_cache[guild.id] = channel.id
                         break
                 if dashboard_channel:
                     break
             
             if not dashboard_channel:
                 # Create the dashboard channel if it doesn't exist
+                guild = self.bot.guilds[0]  # Use first guild
+
+                # Fail fast if creation already failed or we lack the
+                # permission, so we don't waste the REST call
+                if guild.id in self.bot._channel_create_failed:
+                    return
+                if not guild.me.guild_permissions.manage_channels:
+                    logger.warning(f"Missing manage_channels permission in {guild.name}, cannot create dashboard channel")
+                    self.bot._channel_create_failed.add(guild.id)
+                    return
+
                 try:
-                    guild = self.bot.guilds[0]  # Use first guild
                     overwrites = {
                         guild.default_role: discord.PermissionOverwrite(read_messages=True),
                         guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_messages=True)
@@ -175,14 +274,17 @@ class StrikeDashboard:
                         overwrites=overwrites,
                         reason="Strike system dashboard"
                     )
+                    self.bot._dashboard_cache[guild.id] = dashboard_channel.id
                     logger.info(f"Created dashboard channel: {DASHBOARD_CHANNEL_NAME}")
                 except Exception as e:
                     logger.error(f"Error creating dashboard channel: {e}")
+                    self.bot._channel_create_failed.add(guild.id)
                     return
             
             embed = await self.create_dashboard_embed()
             message = await dashboard_channel.send(embed=embed)
-            
+            self._last_embed_hash = self._embed_hash(embed)
+
             # Save message ID
             await self.strike_manager.db.save_dashboard_message(dashboard_channel.id, message.id)
             logger.info("New dashboard message created")
@@ -197,23 +299,61 @@ class StrikeDashboard:
         self.update_task = self.bot.loop.create_task(self._update_loop(interval))
         logger.info("Dashboard auto-updates started")
     
+    def request_update(self):
+        """Wake the update loop early after a strike mutation"""
+        self._wake.set()
+
     async def _update_loop(self, interval):
-        """Background task to update dashboard periodically"""
+        """Background task to update the dashboard on strike events
+
+        Sleeps until the next strike reset is due (or `interval` when no
+        strikes are active) and wakes early whenever a strike mutation
+        sets `_wake`, so idle periods do no DB or Discord work.
+        """
         await self.bot.wait_until_ready()
-        
+
         # Initial delay
         await asyncio.sleep(15)
-        
+
+        backoff = 1
         while not self.bot.is_closed():
             try:
                 # Reset expired strikes
                 reset_count = await self.strike_manager.reset_expired_strikes()
                 if reset_count > 0:
                     logger.info(f"Reset {reset_count} expired strikes")
-                
-                # Update dashboard
-                await self.update_dashboard()
-                await asyncio.sleep(interval)
+
+                # Shield the edit so a shutdown cancellation doesn't
+                # abort an in-flight REST call mid-request
+                await asyncio.shield(self.update_dashboard())
+
+                # Sleep until the next reset is due or a mutation wakes us
+                next_reset = await asyncio.to_thread(
+                    self.strike_manager.db.get_next_reset_time
+                )
+                if next_reset:
+                    timeout = max(1, (next_reset - datetime.now()).total_seconds())
+                else:
+                    timeout = interval
+
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                    # Debounce: strikes arriving in this window are
+                    # absorbed into the same edit
+                    await asyncio.sleep(self._debounce)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+            except asyncio.CancelledError:
+                raise
+            except discord.HTTPException as e:
+                # Transient Discord errors: retry with backoff instead
+                # of waiting out the whole interval
+                backoff = min(backoff * 2, 60)
+                logger.error(f"Discord error in dashboard update loop, retrying in {backoff}s: {e}")
+                await asyncio.sleep(backoff)
             except Exception as e:
                 logger.error(f"Error in dashboard update loop: {e}")
-                await asyncio.sleep(interval)
\ No newline at end of file
+                await asyncio.sleep(interval)
+            else:
+                backoff = 1
\ No newline at end of file
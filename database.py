@@ -1,303 +1,669 @@
-import sqlite3
-import json
-from datetime import datetime, timedelta
-import logging
-import time
-import os
-import asyncio
-
-logger = logging.getLogger(__name__)
-
-class StrikeDatabase:
-    def __init__(self, db_path="data/strikes.db"):
-        self.db_path = db_path
-        self._db_lock = asyncio.Lock()
-        self.init_db()
-    
-    def get_connection(self):
-        """Get a database connection"""
-        try:
-            # Ensure data directory exists
-            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            
-            conn = sqlite3.connect(
-                self.db_path, 
-                timeout=30.0,
-                check_same_thread=False
-            )
-            
-            # Enable WAL mode for better concurrency
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=10000")
-            conn.execute("PRAGMA busy_timeout=10000")
-            
-            return conn
-        except sqlite3.OperationalError as e:
-            logger.error(f"Failed to get database connection: {e}")
-            # Retry once after a short delay
-            time.sleep(0.1)
-            conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
-            conn.execute("PRAGMA journal_mode=WAL")
-            return conn
-    
-    def init_db(self):
-        """Initialize database tables"""
-        logger.info("Initializing database...")
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            # Strikes table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS strikes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    moderator_id INTEGER NOT NULL,
-                    reason TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    reset_time DATETIME NOT NULL,
-                    active BOOLEAN DEFAULT 1
-                )
-            ''')
-            
-            # Violations table (cumulative count)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS violations (
-                    user_id INTEGER PRIMARY KEY,
-                    violation_count INTEGER DEFAULT 0,
-                    last_timeout DATETIME
-                )
-            ''')
-            
-            # Dashboard message ID
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS bot_state (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            ''')
-            
-            conn.commit()
-            logger.info("Database initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing database: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
-    
-    async def add_strike(self, user_id, moderator_id, reason, reset_hours=72):
-        """Add a new strike for a user"""
-        async with self._db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                now = datetime.now()
-                reset_time = now + timedelta(hours=reset_hours)
-                
-                cursor.execute('''
-                    INSERT INTO strikes (user_id, moderator_id, reason, timestamp, reset_time, active)
-                    VALUES (?, ?, ?, ?, ?, 1)
-                ''', (user_id, moderator_id, reason, now, reset_time))
-                
-                strike_id = cursor.lastrowid
-                
-                # Get current active strike count
-                cursor.execute('''
-                    SELECT COUNT(*) FROM strikes 
-                    WHERE user_id = ? AND active = 1
-                ''', (user_id,))
-                strike_count = cursor.fetchone()[0]
-                
-                conn.commit()
-                return strike_id, strike_count
-            except Exception as e:
-                logger.error(f"Error adding strike: {e}")
-                conn.rollback()
-                raise e
-            finally:
-                conn.close()
-    
-    def get_active_strikes(self, user_id):
-        """Get all active strikes for a user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                SELECT * FROM strikes 
-                WHERE user_id = ? AND active = 1 
-                ORDER BY timestamp DESC
-            ''', (user_id,))
-            
-            strikes = cursor.fetchall()
-            return strikes
-        finally:
-            conn.close()
-    
-    def get_user_strike_info(self, user_id):
-        """Get comprehensive strike info for a user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            # Get active strikes
-            cursor.execute('''
-                SELECT COUNT(*) FROM strikes 
-                WHERE user_id = ? AND active = 1
-            ''', (user_id,))
-            active_strikes = cursor.fetchone()[0]
-            
-            # Get next reset time
-            cursor.execute('''
-                SELECT MIN(reset_time) FROM strikes 
-                WHERE user_id = ? AND active = 1
-            ''', (user_id,))
-            reset_result = cursor.fetchone()[0]
-            
-            # Get violation count
-            cursor.execute('''
-                SELECT violation_count FROM violations 
-                WHERE user_id = ?
-            ''', (user_id,))
-            violation_result = cursor.fetchone()
-            violation_count = violation_result[0] if violation_result else 0
-            
-            conn.close()
-            
-            return {
-                'active_strikes': active_strikes,
-                'next_reset': datetime.fromisoformat(reset_result) if reset_result else None,
-                'violation_count': violation_count
-            }
-        except Exception as e:
-            logger.error(f"Error getting user strike info: {e}")
-            conn.close()
-            return {'active_strikes': 0, 'next_reset': None, 'violation_count': 0}
-    
-    def get_all_active_strikes(self):
-        """Get all active strikes across all users"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('''
-                SELECT s.*, 
-                       COALESCE((SELECT violation_count FROM violations WHERE user_id = s.user_id), 0) as violation_count
-                FROM strikes s
-                WHERE s.active = 1
-                ORDER BY s.user_id, s.timestamp DESC
-            ''')
-            
-            strikes = cursor.fetchall()
-            return strikes
-        except Exception as e:
-            logger.error(f"Error getting all active strikes: {e}")
-            return []
-        finally:
-            conn.close()
-    
-    async def reset_expired_strikes(self):
-        """Reset strikes that have passed their reset time"""
-        async with self._db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                now = datetime.now()
-                cursor.execute('''
-                    UPDATE strikes 
-                    SET active = 0 
-                    WHERE reset_time < ? AND active = 1
-                ''', (now,))
-                
-                # Use rowcount instead of changes
-                reset_count = cursor.rowcount
-                conn.commit()
-                return reset_count
-            except Exception as e:
-                logger.error(f"Error resetting expired strikes: {e}")
-                conn.rollback()
-                return 0
-            finally:
-                conn.close()
-    
-    async def increment_violation_count(self, user_id):
-        """Increment violation count for a user"""
-        async with self._db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO violations (user_id, violation_count, last_timeout)
-                    VALUES (?, COALESCE((SELECT violation_count FROM violations WHERE user_id = ?), 0) + 1, ?)
-                ''', (user_id, user_id, datetime.now()))
-                
-                cursor.execute('SELECT violation_count FROM violations WHERE user_id = ?', (user_id,))
-                result = cursor.fetchone()
-                violation_count = result[0] if result else 1
-                
-                conn.commit()
-                return violation_count
-            except Exception as e:
-                logger.error(f"Error incrementing violation count: {e}")
-                conn.rollback()
-                return 1
-            finally:
-                conn.close()
-    
-    def get_violation_count(self, user_id):
-        """Get violation count for a user"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('SELECT violation_count FROM violations WHERE user_id = ?', (user_id,))
-            result = cursor.fetchone()
-            violation_count = result[0] if result else 0
-            return violation_count
-        finally:
-            conn.close()
-    
-    async def save_dashboard_message(self, channel_id, message_id):
-        """Save dashboard message ID"""
-        async with self._db_lock:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                cursor.execute('''
-                    INSERT OR REPLACE INTO bot_state (key, value)
-                    VALUES ('dashboard_message', ?)
-                ''', (f"{channel_id}:{message_id}",))
-                
-                conn.commit()
-            except Exception as e:
-                logger.error(f"Error saving dashboard message: {e}")
-                conn.rollback()
-            finally:
-                conn.close()
-    
-    def get_dashboard_message(self):
-        """Get dashboard message ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute('SELECT value FROM bot_state WHERE key = "dashboard_message"')
-            result = cursor.fetchone()
-            
-            if result:
-                try:
-                    channel_id, message_id = result[0].split(':')
-                    return int(channel_id), int(message_id)
-                except (ValueError, IndexError):
-                    return None, None
-            return None, None
-        except Exception as e:
-            logger.error(f"Error getting dashboard message: {e}")
-            return None, None
-        finally:
-            conn.close()
\ No newline at end of file
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+import logging
+import queue
+import threading
+import time
+import os
+import asyncio
+
+logger = logging.getLogger(__name__)
+
+# Sentinel distinguishing a cache miss from a cached falsy value
+_CACHE_MISS = object()
+
+# Hot-path SQL hoisted to module constants: sqlite3's per-connection
+# statement cache keys on the string object, so identical objects hit
+# the cached prepared statement instead of re-parsing
+_SQL_INSERT_STRIKE = '''
+    INSERT INTO strikes (user_id, moderator_id, reason, timestamp, reset_time, active)
+    VALUES (?, ?, ?, ?, ?, 1)
+    RETURNING id,
+              (SELECT COUNT(*) FROM strikes
+               WHERE user_id = ? AND active = 1)
+'''
+
+_SQL_INSERT_STRIKE_BULK = '''
+    INSERT INTO strikes (user_id, moderator_id, reason, timestamp, reset_time, active)
+    VALUES (?, ?, ?, ?, ?, 1)
+'''
+
+_SQL_ACTIVE_STRIKES = '''
+    SELECT id, moderator_id, reason, timestamp, reset_time
+    FROM strikes
+    WHERE user_id = ? AND active = 1
+    ORDER BY timestamp DESC
+'''
+
+_SQL_REMOVE_LATEST_STRIKE = '''
+    UPDATE strikes SET active = 0
+    WHERE id = (
+        SELECT id FROM strikes
+        WHERE user_id = ? AND active = 1
+        ORDER BY timestamp DESC, id DESC
+        LIMIT 1
+    )
+    RETURNING id
+'''
+
+_SQL_USER_STRIKE_INFO = '''
+    SELECT
+        (SELECT COUNT(*) FROM strikes
+         WHERE user_id = ?1 AND active = 1),
+        (SELECT MIN(reset_time) FROM strikes
+         WHERE user_id = ?1 AND active = 1),
+        COALESCE((SELECT violation_count FROM violations
+                  WHERE user_id = ?1), 0)
+'''
+
+_SQL_ACTIVE_COUNT = 'SELECT COUNT(*) FROM strikes WHERE active = 1'
+
+_SQL_NEXT_RESET = 'SELECT MIN(reset_time) FROM strikes WHERE active = 1'
+
+_SQL_DASHBOARD_ROWS = '''
+    SELECT s.user_id,
+           COUNT(*) AS strike_count,
+           MIN(s.reset_time) AS next_reset,
+           (SELECT reason FROM strikes
+            WHERE user_id = s.user_id AND active = 1
+            ORDER BY timestamp DESC LIMIT 1) AS latest_reason,
+           (SELECT moderator_id FROM strikes
+            WHERE user_id = s.user_id AND active = 1
+            ORDER BY timestamp DESC LIMIT 1) AS latest_moderator,
+           COALESCE(v.violation_count, 0) AS violation_count
+    FROM strikes s
+    LEFT JOIN violations v ON v.user_id = s.user_id
+    WHERE s.active = 1
+    GROUP BY s.user_id
+    ORDER BY s.user_id
+'''
+
+_SQL_ALL_ACTIVE_STRIKES = '''
+    SELECT s.user_id, s.moderator_id, s.reason, s.timestamp, s.reset_time,
+           COALESCE((SELECT violation_count FROM violations WHERE user_id = s.user_id), 0) as violation_count
+    FROM strikes s
+    WHERE s.active = 1
+    ORDER BY s.user_id, s.timestamp DESC
+'''
+
+_SQL_EXPIRED_PROBE = '''
+    SELECT 1 FROM strikes
+    WHERE active = 1 AND reset_time < ?
+    LIMIT 1
+'''
+
+_SQL_RESET_EXPIRED = '''
+    UPDATE strikes
+    SET active = 0
+    WHERE reset_time < ? AND active = 1
+'''
+
+_SQL_UPSERT_VIOLATION = '''
+    INSERT INTO violations (user_id, violation_count, last_timeout)
+    VALUES (?, 1, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        violation_count = violation_count + 1,
+        last_timeout = excluded.last_timeout
+    RETURNING violation_count
+'''
+
+_SQL_GET_VIOLATION = 'SELECT violation_count FROM violations WHERE user_id = ?'
+
+_SQL_SAVE_DASHBOARD_MSG = '''
+    INSERT INTO dashboard_msg (id, channel_id, message_id)
+    VALUES (1, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        channel_id = excluded.channel_id,
+        message_id = excluded.message_id
+'''
+
+_SQL_GET_DASHBOARD_MSG = 'SELECT channel_id, message_id FROM dashboard_msg WHERE id = 1'
+
+class StrikeDatabase:
+    # Reader connections kept in the pool; WAL lets them run
+    # concurrently with the single writer
+    READER_POOL_SIZE = 4
+    # Per-user read cache: short TTL keeps the dashboard correct while
+    # repeated checks within a tick skip SQLite entirely
+    USER_CACHE_TTL = 5  # seconds
+    USER_CACHE_MAX = 1024
+    # Async write locks sharded by user id so unrelated users don't
+    # queue behind each other (must be a power of two)
+    LOCK_SHARDS = 16
+
+    def __init__(self, db_path="data/strikes.db"):
+        self.db_path = db_path
+        # Global lock for writes that aren't scoped to one user
+        # (expiry sweeps, dashboard state)
+        self._db_lock = asyncio.Lock()
+        self._locks = [asyncio.Lock() for _ in range(self.LOCK_SHARDS)]
+        # Serializes use of the dedicated writer connection across
+        # threads (writes may run on executor threads)
+        self._writer_lock = threading.RLock()
+        self._writer_conn = None
+        self._readers = queue.Queue()
+        self._user_cache: dict = {}
+        self.init_db()
+
+        for _ in range(self.READER_POOL_SIZE):
+            self._readers.put(self._make_connection())
+
+    def _make_connection(self):
+        """Create and configure a new database connection"""
+        # Ensure data directory exists
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        # isolation_level=None: autocommit mode, transactions are opened
+        # explicitly with BEGIN IMMEDIATE so the write lock is taken
+        # upfront instead of racing at commit time
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=30.0,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None
+        )
+
+        # Enable WAL mode for better concurrency
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=10000")
+        # Server-SQLite profile: in-memory temp sorts, mmap'd page
+        # reads, 64 MiB page cache, and less frequent WAL checkpoints
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=134217728")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA wal_autocheckpoint=2000")
+
+        return conn
+
+    @contextmanager
+    def writer(self):
+        """Get the dedicated long-lived writer connection"""
+        with self._writer_lock:
+            if self._writer_conn is None:
+                try:
+                    self._writer_conn = self._make_connection()
+                except sqlite3.OperationalError as e:
+                    logger.error(f"Failed to get database connection: {e}")
+                    # Retry once after a short delay
+                    time.sleep(0.1)
+                    self._writer_conn = self._make_connection()
+            yield self._writer_conn
+
+    @contextmanager
+    def _immediate(self, conn):
+        """Explicit BEGIN IMMEDIATE transaction on a writer connection
+
+        Taking the write lock deterministically at BEGIN avoids the
+        SQLITE_BUSY upgrade races of deferred transactions under WAL.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    @contextmanager
+    def reader(self):
+        """Borrow a reader connection from the pool
+
+        Readers never block behind the writer lock, so dashboard and
+        strike-info queries proceed concurrently with writes under WAL.
+        """
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._make_connection()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def _lock_for(self, user_id):
+        """Async write lock shard for a user id"""
+        return self._locks[user_id & (self.LOCK_SHARDS - 1)]
+
+    def _cache_get(self, key):
+        """Get a cached value, or _CACHE_MISS if absent/expired"""
+        entry = self._user_cache.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        return _CACHE_MISS
+
+    def _cache_put(self, key, value):
+        if len(self._user_cache) >= self.USER_CACHE_MAX:
+            self._user_cache.clear()
+        self._user_cache[key] = (value, time.monotonic() + self.USER_CACHE_TTL)
+
+    def invalidate_user_cache(self, user_id=None):
+        """Drop cached reads for a user (or everyone) after a write"""
+        if user_id is None:
+            self._user_cache.clear()
+        else:
+            self._user_cache.pop(('info', user_id), None)
+            self._user_cache.pop(('violations', user_id), None)
+
+    def init_db(self):
+        """Initialize database tables"""
+        logger.info("Initializing database...")
+
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                with self._immediate(conn):
+                    # Strikes table (timestamp/reset_time are unix epoch seconds)
+                    cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS strikes (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            user_id INTEGER NOT NULL,
+                            moderator_id INTEGER NOT NULL,
+                            reason TEXT NOT NULL,
+                            timestamp INTEGER NOT NULL,
+                            reset_time INTEGER NOT NULL,
+                            active BOOLEAN DEFAULT 1
+                        )
+                    ''')
+
+                    # One-time migration: convert ISO-text datetimes to epoch
+                    # seconds (idempotent thanks to the typeof guards).
+                    # Legacy rows were written with local-time
+                    # datetime.now(), so the 'utc' modifier treats the
+                    # text as localtime rather than shifting it
+                    cursor.execute('''
+                        UPDATE strikes
+                        SET reset_time = CAST(strftime('%s', reset_time, 'utc') AS INTEGER)
+                        WHERE typeof(reset_time) = 'text'
+                    ''')
+                    cursor.execute('''
+                        UPDATE strikes
+                        SET timestamp = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)
+                        WHERE typeof(timestamp) = 'text'
+                    ''')
+
+                    # Violations table (cumulative count)
+                    cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS violations (
+                            user_id INTEGER PRIMARY KEY,
+                            violation_count INTEGER DEFAULT 0,
+                            last_timeout DATETIME
+                        )
+                    ''')
+
+                    # Covering indexes: the dashboard aggregate groups active
+                    # strikes by user, and expiry filters on (active, reset_time)
+                    cursor.execute('''
+                        CREATE INDEX IF NOT EXISTS idx_strikes_active_user
+                        ON strikes(active, user_id, reset_time)
+                    ''')
+                    cursor.execute('''
+                        CREATE INDEX IF NOT EXISTS idx_strikes_reset
+                        ON strikes(active, reset_time)
+                    ''')
+                    # Per-user lookups (strike info, add_strike's count,
+                    # remove/reset) filter on (user_id, active)
+                    cursor.execute('''
+                        CREATE INDEX IF NOT EXISTS idx_strikes_user_active_reset
+                        ON strikes(user_id, active, reset_time)
+                    ''')
+
+                    # Dashboard message pointer: typed INTEGER columns so
+                    # reads don't split/parse a "chan:msg" string
+                    cursor.execute('''
+                        CREATE TABLE IF NOT EXISTS dashboard_msg (
+                            id INTEGER PRIMARY KEY CHECK (id = 1),
+                            channel_id INTEGER,
+                            message_id INTEGER
+                        )
+                    ''')
+
+                    # One-time migration from the legacy bot_state row
+                    cursor.execute('''
+                        SELECT name FROM sqlite_master
+                        WHERE type = 'table' AND name = 'bot_state'
+                    ''')
+                    if cursor.fetchone():
+                        cursor.execute(
+                            'SELECT value FROM bot_state WHERE key = "dashboard_message"'
+                        )
+                        row = cursor.fetchone()
+                        if row:
+                            try:
+                                chan, msg = row[0].split(':')
+                                cursor.execute(
+                                    _SQL_SAVE_DASHBOARD_MSG, (int(chan), int(msg))
+                                )
+                            except (ValueError, IndexError):
+                                pass
+                        cursor.execute('DROP TABLE bot_state')
+
+                    # Refresh planner statistics so the new indexes get picked
+                    cursor.execute('ANALYZE')
+
+                logger.info("Database initialized successfully")
+            except Exception as e:
+                logger.error(f"Error initializing database: {e}")
+
+    def _add_strike_sync(self, user_id, moderator_id, reason, reset_hours):
+        """Blocking part of add_strike; runs on a worker thread"""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                now_ts = int(time.time())
+                reset_ts = now_ts + reset_hours * 3600
+
+                # Single statement: RETURNING yields the new id and the
+                # active count (including this row) in one round-trip
+                with self._immediate(conn):
+                    cursor.execute(_SQL_INSERT_STRIKE,
+                                   (user_id, moderator_id, reason, now_ts, reset_ts, user_id))
+
+                    strike_id, strike_count = cursor.fetchone()
+
+                self.invalidate_user_cache(user_id)
+                return strike_id, strike_count
+            except Exception as e:
+                logger.error(f"Error adding strike: {e}")
+                raise e
+
+    async def add_strike(self, user_id, moderator_id, reason, reset_hours=72):
+        """Add a new strike for a user"""
+        async with self._lock_for(user_id):
+            return await asyncio.to_thread(
+                self._add_strike_sync, user_id, moderator_id, reason, reset_hours
+            )
+
+    def _add_strikes_bulk_sync(self, rows, reset_hours):
+        """Blocking part of add_strikes_bulk; runs on a worker thread"""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                now_ts = int(time.time())
+                reset_ts = now_ts + reset_hours * 3600
+
+                # One transaction for the whole batch: a single fsync
+                # instead of one per row
+                with self._immediate(conn):
+                    cursor.executemany(
+                        _SQL_INSERT_STRIKE_BULK,
+                        [(user_id, moderator_id, reason, now_ts, reset_ts)
+                         for user_id, moderator_id, reason in rows]
+                    )
+                    inserted = cursor.rowcount
+
+                for user_id, _, _ in rows:
+                    self.invalidate_user_cache(user_id)
+                return inserted
+            except Exception as e:
+                logger.error(f"Error adding strikes in bulk: {e}")
+                raise e
+
+    async def add_strikes_bulk(self, rows, reset_hours=72):
+        """Add strikes for several users in one transaction.
+
+        `rows` is an iterable of (user_id, moderator_id, reason)
+        tuples. Returns the number of strikes inserted. Unlike
+        add_strike this does not report per-user counts; callers doing
+        punishment checks should read those afterwards.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        # The batch spans users, so take the global write lock
+        async with self._db_lock:
+            return await asyncio.to_thread(self._add_strikes_bulk_sync, rows, reset_hours)
+
+    def _run_write_sync(self, sql, params):
+        """Blocking part of _run_write; runs on a worker thread"""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            with self._immediate(conn):
+                cursor.execute(sql, params)
+                return cursor.rowcount
+
+    async def _run_write(self, sql, params=(), user_id=None):
+        """Run a single write statement on the writer connection.
+
+        Takes the user's lock shard when the write is scoped to one
+        user, otherwise the global write lock, so ad-hoc writes follow
+        the same discipline as the named write methods. Returns the
+        statement's rowcount.
+        """
+        lock = self._lock_for(user_id) if user_id is not None else self._db_lock
+        async with lock:
+            return await asyncio.to_thread(self._run_write_sync, sql, params)
+
+    def _remove_latest_strike_sync(self, user_id):
+        """Blocking part of remove_latest_strike; runs on a worker thread"""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                # Single statement: the subquery picks the newest active
+                # strike and RETURNING confirms whether one existed
+                with self._immediate(conn):
+                    cursor.execute(_SQL_REMOVE_LATEST_STRIKE, (user_id,))
+                    row = cursor.fetchone()
+
+                self.invalidate_user_cache(user_id)
+                return row[0] if row else None
+            except Exception as e:
+                logger.error(f"Error removing strike: {e}")
+                raise e
+
+    async def remove_latest_strike(self, user_id):
+        """Deactivate the user's most recent active strike.
+
+        Returns the removed strike id, or None when the user has no
+        active strikes.
+        """
+        async with self._lock_for(user_id):
+            return await asyncio.to_thread(self._remove_latest_strike_sync, user_id)
+
+    def get_active_strikes(self, user_id):
+        """Get all active strikes for a user.
+
+        Rows are (id, moderator_id, reason, timestamp, reset_time),
+        newest first.
+        """
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(_SQL_ACTIVE_STRIKES, (user_id,))
+
+            return cursor.fetchall()
+
+    def get_user_strike_info(self, user_id):
+        """Get comprehensive strike info for a user"""
+        cached = self._cache_get(('info', user_id))
+        if cached is not _CACHE_MISS:
+            return cached
+
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                # Active count, next reset, and violation count in one
+                # statement instead of three round-trips
+                cursor.execute(_SQL_USER_STRIKE_INFO, (user_id,))
+                active_strikes, reset_result, violation_count = cursor.fetchone()
+
+                info = {
+                    'active_strikes': active_strikes,
+                    'next_reset': datetime.fromtimestamp(reset_result) if reset_result else None,
+                    'violation_count': violation_count
+                }
+                self._cache_put(('info', user_id), info)
+                return info
+            except Exception as e:
+                logger.error(f"Error getting user strike info: {e}")
+                return {'active_strikes': 0, 'next_reset': None, 'violation_count': 0}
+
+    def get_active_strike_count(self):
+        """Get the total number of active strikes"""
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(_SQL_ACTIVE_COUNT)
+                return cursor.fetchone()[0]
+            except Exception as e:
+                logger.error(f"Error getting active strike count: {e}")
+                return 0
+
+    def get_next_reset_time(self):
+        """Get the earliest reset time among all active strikes"""
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(_SQL_NEXT_RESET)
+                result = cursor.fetchone()[0]
+                return datetime.fromtimestamp(result) if result else None
+            except Exception as e:
+                logger.error(f"Error getting next reset time: {e}")
+                return None
+
+    def get_dashboard_rows(self):
+        """Get pre-aggregated per-user rows for the dashboard in one query"""
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(_SQL_DASHBOARD_ROWS)
+
+                return cursor.fetchall()
+            except Exception as e:
+                logger.error(f"Error getting dashboard rows: {e}")
+                return []
+
+    def get_all_active_strikes(self):
+        """Get all active strikes across all users.
+
+        Rows are (user_id, moderator_id, reason, timestamp, reset_time,
+        violation_count), grouped by user with newest strikes first.
+        """
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(_SQL_ALL_ACTIVE_STRIKES)
+
+                return cursor.fetchall()
+            except Exception as e:
+                logger.error(f"Error getting all active strikes: {e}")
+                return []
+
+    def _reset_expired_strikes_sync(self):
+        """Blocking part of reset_expired_strikes; runs on a worker thread"""
+        now_ts = int(time.time())
+
+        # Probe on a reader first: when nothing has expired we skip the
+        # writer lock and the commit fsync entirely
+        with self.reader() as conn:
+            cursor = conn.execute(_SQL_EXPIRED_PROBE, (now_ts,))
+            if cursor.fetchone() is None:
+                return 0
+
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                with self._immediate(conn):
+                    cursor.execute(_SQL_RESET_EXPIRED, (now_ts,))
+
+                    # Use rowcount instead of changes
+                    reset_count = cursor.rowcount
+
+                if reset_count > 0:
+                    self.invalidate_user_cache()
+                return reset_count
+            except Exception as e:
+                logger.error(f"Error resetting expired strikes: {e}")
+                return 0
+
+    async def reset_expired_strikes(self):
+        """Reset strikes that have passed their reset time"""
+        async with self._db_lock:
+            return await asyncio.to_thread(self._reset_expired_strikes_sync)
+
+    def _increment_violation_count_sync(self, user_id):
+        """Blocking part of increment_violation_count; runs on a worker thread"""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                # Native UPSERT: single B-tree traversal, no
+                # delete-then-insert, and RETURNING skips the follow-up
+                # SELECT
+                with self._immediate(conn):
+                    cursor.execute(_SQL_UPSERT_VIOLATION, (user_id, int(time.time())))
+
+                    violation_count = cursor.fetchone()[0]
+
+                self.invalidate_user_cache(user_id)
+                return violation_count
+            except Exception as e:
+                logger.error(f"Error incrementing violation count: {e}")
+                return 1
+
+    async def increment_violation_count(self, user_id):
+        """Increment violation count for a user"""
+        async with self._lock_for(user_id):
+            return await asyncio.to_thread(self._increment_violation_count_sync, user_id)
+
+    def get_violation_count(self, user_id):
+        """Get violation count for a user"""
+        cached = self._cache_get(('violations', user_id))
+        if cached is not _CACHE_MISS:
+            return cached
+
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(_SQL_GET_VIOLATION, (user_id,))
+            result = cursor.fetchone()
+            violation_count = result[0] if result else 0
+            self._cache_put(('violations', user_id), violation_count)
+            return violation_count
+
+    def _save_dashboard_message_sync(self, channel_id, message_id):
+        """Blocking part of save_dashboard_message; runs on a worker thread"""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+
+            try:
+                with self._immediate(conn):
+                    cursor.execute(_SQL_SAVE_DASHBOARD_MSG, (channel_id, message_id))
+            except Exception as e:
+                logger.error(f"Error saving dashboard message: {e}")
+
+    async def save_dashboard_message(self, channel_id, message_id):
+        """Save dashboard message ID"""
+        async with self._db_lock:
+            await asyncio.to_thread(
+                self._save_dashboard_message_sync, channel_id, message_id
+            )
+
+    def get_dashboard_message(self):
+        """Get dashboard message ID"""
+        with self.reader() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute(_SQL_GET_DASHBOARD_MSG)
+                result = cursor.fetchone()
+
+                if result:
+                    return result[0], result[1]
+                return None, None
+            except Exception as e:
+                logger.error(f"Error getting dashboard message: {e}")
+                return None, None
@@ -28,6 +28,15 @@ async def start_web_server():
     print(f"Health check server started on port {port}")
     return runner
 
+async def _ping(session, url):
+    """Ping a single URL and log the result"""
+    try:
+        async with session.get(url) as response:
+            if response.status == 200:
+                print(f"Pinged {url} successfully at {time.ctime()}")
+    except Exception as e:
+        print(f"Error pinging {url}: {e}")
+
 async def keep_alive_ping():
     """Periodically ping external services to keep the bot awake"""
     # List of services to ping (prevents Render from spinning down)
@@ -35,19 +44,21 @@ async def keep_alive_ping():
         "https://hammerofjustice.omender.com/health",
         "https://httpstat.us/200"
     ]
-    
-    while True:
-        for url in ping_urls:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, timeout=10) as response:
-                        if response.status == 200:
-                            print(f"Pinged {url} successfully at {time.ctime()}")
-            except Exception as e:
-                print(f"Error pinging {url}: {e}")
-        
-        # Wait 10 minutes between pings
-        await asyncio.sleep(600)  # 600 seconds = 10 minutes
+
+    # One session for the task's lifetime so connections (and TLS
+    # handshakes) are reused across pings
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        while True:
+            # Ping everything concurrently; cycle latency is the
+            # slowest URL rather than the sum of them
+            await asyncio.gather(
+                *(_ping(session, url) for url in ping_urls),
+                return_exceptions=True
+            )
+
+            # Wait 10 minutes between pings
+            await asyncio.sleep(600)  # 600 seconds = 10 minutes
 
 async def main():
     """Main async function to run everything"""
@@ -57,8 +68,7 @@ async def main():
     
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
-    time.sleep(1)
-    
+
     print("Starting Discord Strike Bot with keep-alive system...")
     
     # Start the health check web server
@@ -1,3 +1,4 @@
+import asyncio
 import discord
 from datetime import datetime, timedelta
 import logging
@@ -10,7 +11,16 @@ class StrikeManager:
     def __init__(self, bot):
         self.bot = bot
         self.db = StrikeDatabase()
-    
+        # In-memory count of active strikes so idle dashboard ticks can
+        # skip the database entirely
+        self._active_count = self.db.get_active_strike_count()
+
+    def _notify_dashboard(self):
+        """Wake the dashboard update loop after a strike mutation"""
+        dashboard = getattr(self.bot, 'dashboard', None)
+        if dashboard:
+            dashboard.request_update()
+
     async def give_strike(self, user, moderator, reason):
         """Give a strike to a user and handle punishments"""
         try:
@@ -18,9 +28,13 @@ class StrikeManager:
             
             logger.info(f"Strike #{strike_id} given to {user} by {moderator}. Reason: {reason}")
             
+            self._active_count += 1
+
             # Check if punishment should be applied
             violation_count = await self.check_punishment(user, strike_count)
-            
+
+            self._notify_dashboard()
+
             return {
                 'strike_id': strike_id,
                 'strike_count': strike_count,
@@ -37,6 +51,26 @@ class StrikeManager:
                 'next_reset': datetime.now()
             }
     
+    async def give_strikes_bulk(self, rows):
+        """Give strikes to several users in a single transaction.
+
+        `rows` is an iterable of (user_id, moderator_id, reason)
+        tuples. Skips the per-user punishment check; intended for bulk
+        moderator actions where timeouts are handled separately.
+        """
+        try:
+            inserted = await self.db.add_strikes_bulk(rows, STRIKE_RESET_HOURS)
+
+            if inserted:
+                self._active_count += inserted
+                logger.info(f"Bulk-inserted {inserted} strikes")
+                self._notify_dashboard()
+
+            return inserted
+        except Exception as e:
+            logger.error(f"Error giving strikes in bulk: {e}")
+            return 0
+
     async def check_punishment(self, user, strike_count):
         """Check and apply punishment if user has 3+ strikes"""
         if strike_count >= 3:
@@ -51,40 +85,32 @@ class StrikeManager:
                 return violation_count
             except discord.Forbidden:
                 logger.error(f"Missing permissions to timeout {user}")
-                return self.db.get_violation_count(user.id)
+                return await asyncio.to_thread(self.db.get_violation_count, user.id)
             except Exception as e:
                 logger.error(f"Error timing out {user}: {e}")
-                return self.db.get_violation_count(user.id)
-        
-        return self.db.get_violation_count(user.id)
+                return await asyncio.to_thread(self.db.get_violation_count, user.id)
+
+        return await asyncio.to_thread(self.db.get_violation_count, user.id)
     
     async def remove_strike(self, user_id):
         """Remove the most recent strike from a user"""
         try:
-            # Get active strikes
-            active_strikes = self.db.get_active_strikes(user_id)
-            
-            if not active_strikes:
-                return {'removed': False, 'strike_count': 0, 'violation_count': self.db.get_violation_count(user_id)}
-            
-            # Remove the most recent strike (first in the list)
-            strike_to_remove = active_strikes[0]
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE strikes SET active = 0 WHERE id = ?
-            ''', (strike_to_remove[0],))
-            
-            conn.commit()
-            conn.close()
-            
+            # Single UPDATE picks and deactivates the newest active strike
+            removed_id = await self.db.remove_latest_strike(user_id)
+
+            if removed_id is None:
+                violation_count = await asyncio.to_thread(self.db.get_violation_count, user_id)
+                return {'removed': False, 'strike_count': 0, 'violation_count': violation_count}
+
             # Get updated strike count
-            strike_info = self.db.get_user_strike_info(user_id)
-            
-            logger.info(f"Removed strike #{strike_to_remove[0]} from user {user_id}")
-            
+            strike_info = await asyncio.to_thread(self.db.get_user_strike_info, user_id)
+
+            self._active_count = max(0, self._active_count - 1)
+
+            logger.info(f"Removed strike #{removed_id} from user {user_id}")
+
+            self._notify_dashboard()
+
             return {
                 'removed': True,
                 'strike_count': strike_info['active_strikes'],
@@ -99,26 +125,31 @@ class StrikeManager:
         """Reset all strikes for a user"""
         try:
             # Get current active strikes count
-            strike_info = self.db.get_user_strike_info(user_id)
+            strike_info = await asyncio.to_thread(self.db.get_user_strike_info, user_id)
             active_strikes_count = strike_info['active_strikes']
             
             if active_strikes_count == 0:
                 return {'strikes_removed': 0, 'violation_count': strike_info['violation_count']}
             
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                UPDATE strikes SET active = 0 WHERE user_id = ? AND active = 1
-            ''', (user_id,))
-            
-            conn.commit()
-            conn.close()
-            
-            logger.info(f"Reset all {active_strikes_count} strikes for user {user_id}")
-            
+            removed = await self.db._run_write(
+                'UPDATE strikes SET active = 0 WHERE user_id = ? AND active = 1',
+                (user_id,),
+                user_id=user_id
+            )
+
+            self.db.invalidate_user_cache(user_id)
+
+            # Decrement by what the UPDATE actually touched: the pre-read
+            # count may be stale (TTL cache, concurrent expiry sweep) and
+            # an underflowing counter would blank the dashboard for good
+            self._active_count = max(0, self._active_count - removed)
+
+            logger.info(f"Reset all {removed} strikes for user {user_id}")
+
+            self._notify_dashboard()
+
             return {
-                'strikes_removed': active_strikes_count,
+                'strikes_removed': removed,
                 'violation_count': strike_info['violation_count']  # Violations remain, only strikes reset
             }
             
@@ -133,11 +164,17 @@ class StrikeManager:
     def get_all_active_strikes(self):
         """Get all active strikes"""
         return self.db.get_all_active_strikes()
+
+    def get_dashboard_rows(self):
+        """Get aggregated per-user strike rows for the dashboard"""
+        return self.db.get_dashboard_rows()
     
     async def reset_expired_strikes(self):
         """Reset expired strikes"""
         try:
-            return await self.db.reset_expired_strikes()
+            reset_count = await self.db.reset_expired_strikes()
+            self._active_count = max(0, self._active_count - reset_count)
+            return reset_count
         except Exception as e:
             logger.error(f"Error resetting expired strikes: {e}")
             return 0
\ No newline at end of file